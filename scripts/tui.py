@@ -11,16 +11,39 @@ The base tui only enable commands 'demo', 'clear' & 'quit'. For additional comma
 register(function name, callable function)
 """
 
+import atexit
 import curses
+import inspect
+import os
 import signal
+import sys
 import time
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import psutil
 import queue
 import threading
+from collections import deque
+from itertools import islice
 from math import floor
 
+# accepted answers for PROMPT_YESNO, compared in lower case
+_YESNO = frozenset(('y', 'n', 'yes', 'no'))
+
+# pre-built mask for password input, sliced to the input length
+_STARS = '*' * 1024
+
+# DEC synchronized output (mode 2026) - terminals supporting it present the update at once, others ignore the sequence
+_SYNC_BEGIN = b'\x1b[?2026h'
+_SYNC_END = b'\x1b[?2026l'
+
+
+def _mask(length: int) -> str:
+    """_mask - returns masking string of given length, only allocates for inputs longer than _STARS"""
+    if length <= len(_STARS):
+        return _STARS[:length]
+    return '*' * length
+
 
 # TODO: make class single instance only
 class Tui:
@@ -31,7 +54,7 @@ class Tui:
 
     The user can execute 'registered' functions by their designated moniker. e.g. tui.register('clear', self._clear)
     will enable the user to call the self._clear() function using the command 'clear'. Any additional command line
-    parameters provided will automatically be passed to the function (without sanity check)
+    parameters provided will automatically be passed to the function (only their count is checked)
 
     Args:
         banner(str): Accepts a  string which it prints in the bottom of the footer, may be trimmed based on screen size
@@ -39,81 +62,80 @@ class Tui:
     Attributes:
         _banner(str): stores the banner on instance creation. Cannot be changed later
         _quit(bool): internal flag to trigger TUI/Application Exit
-        _psutil(__Lockable): Maintains the current string description of resource utilisation, atomic is used correctly
-        _tabs({}): collection of tabs - tuple of name, window, buffer, cursor position
+        _psutil(str): current string description of resource utilisation, replaced as a whole by _res_util
+        _res_util_stop(threading.Event): stops the resource utilisation sampling
+        _tabs({}): collection of tabs - name mapped to its __Tab, buffer of each is bounded to BUFFER_LINES
+        _active_tab_name(str): name of the tab currently selected, maintained by _activate
+        _tab_dirty(bool): set when the content of the active tab changes and it has to be re-painted
+        _tab_win(curses.newwin): window shared by the tabs, the active tab is painted on it
+        _tab_shadow([]): rows as printed on _tab_win by the last paint
+        _footer_dirty, _cmdline_dirty(bool): set when the footer, or only the commandline in it, has to be re-painted
+        _footer_drawn, _tabstrip_drawn(bool): whether box or tab strip are on the footer window, reset when they change
+        _prompt_drawn, _status_drawn: prompt and (banner, resource) pair last printed on the footer, None once re-boxed
         _footer(curses.newwin): holds curses window for the static portion of the tui which includes commandline shell
+        _footer_width(int): usable width within the footer box, maintained by _resizeScreen
+        _tab_coordinates, _footer_coordinates(__Rect): layout of the tab and footer windows, maintained by _resizeScreen
+        _attr_normal, _attr_highlight, _attr_footer(int): attributes of the color pairs, set once in _setup
+        _attr_cursor(int): attribute of the commandline cursor, combined once in _setup
+        _attr_severity({}): attribute for the log entries of each severity
 
-        _prompt_lock, _shell_lock, _print_lock, _refresh_lock, _log_lock, _widget_lock(threading.Lock) : enables
+        _prompt_lock, _shell_lock, _refresh_lock, _widget_lock(threading.Lock) : enables
             atomic functions on these sections
+        _buffer_lock(threading.Lock): guards the tab buffers, which are appended to by any thread while being painted
 
-        _dispatch_queue(queue.LifoQueue): dispatch queue for handling keystrokes
-        _input_queue(queue.LifoQueue): waiting queue for user inputs
+        _key_handlers({}): key name mapped to its handler, for the keys which are not part of a command
+        _dispatch_queue(queue.LifoQueue): private single-slot queue of each shell/prompt waiting on user input,
+            the most recent waiter is handed the input first
 
         _widget({}): For running list of widget, progressbar, spinner, etc.
 
         _stdscr: holding instance of curses.initscr
+        _getkey_timeout(int): milliseconds getkey currently waits for, GETKEY_TIMEOUT_ACTIVE or GETKEY_TIMEOUT_IDLE
 
     Examples:
     """
 
-    class __Lockable:
-        def __init__(self, var_type):
-            self.__lock = threading.Lock()
-            self.__var = var_type()
-
-        @property
-        def value(self):
-            with self.__lock:
-                return self.__var
-
-        @value.setter
-        def value(self, var):
-            assert isinstance(self.__var, type(var)), 'Lockable object cannot be recast'
-            with self.__lock:
-                self.__var = var
-
     class __Spinner:
         """ Internal class for Spinner
         Presents a spinner with given character sequence
         Attributes:
             _message(str): the message printed as action of spinner, trimmed to 70 characters
-            _lock: threading lock to keep changes atomic
-            _position(int): index in character array presenting position of the spinner
-            _running(bool): maintains running state of the Spinner
+            _frames([str]): message followed by each of the spinner characters, formatted once on creation
+            _start(int): monotonic time of creation in ns, the position is derived from the time elapsed since
+            _stopped(int | None): elapsed ns when the spinner was stopped, the position is frozen from then on
         """
 
         # Can pick more from
         # https://stackoverflow.com/questions/2685435/cooler-ascii-spinners
         ASCII_CHAR = ['⣾', '⣽', '⣻', '⢿', '⡿', '⣟', '⣯', '⣷']
 
+        # time each character is shown for
+        STEP_NS = 100_000_000
+
         def __init__(self, message):
             self._message: str = message[:70]
-            self._lock = threading.Lock()
-            self._position: int = 0
-            self._running = True
+            self._frames = [self._message + ' ' + c for c in self.ASCII_CHAR]
 
-            # starts the threat which survives till the spinner is running
-            threading.Thread(target=self._step, daemon=True).start()
-
-        def _step(self):
-            """Continuous thread which updates the suffix character till _running is true"""
-            while self._running:
-                time.sleep(0.1)
-                with self._lock:
-                    self._position = (self._position + 1) % len(self.ASCII_CHAR)
+            # no thread of its own, the spinner advances with time whenever it is painted
+            self._start = time.monotonic_ns()
+            self._stopped = None
 
         def done(self):
             """Stopping the Spinner"""
-            self._running = False
+            self._stopped = time.monotonic_ns() - self._start
 
         @property
         def message(self) -> str:
             return self._message
 
+        def render(self, now: int) -> str:
+            """Return str description of Spinner at monotonic time now (ns)"""
+            elapsed = self._stopped if self._stopped is not None else now - self._start
+            return self._frames[elapsed // self.STEP_NS % len(self._frames)]
+
         def __str__(self) -> str:
             """Return str description of Spinner"""
-            with self._lock:
-                return self._message + ' ' + self.ASCII_CHAR[self._position]
+            return self.render(time.monotonic_ns())
 
     class __ProgressBar:
         """ Internal Class for Progressbar
@@ -131,12 +153,17 @@ class Tui:
               _scale_factor: factor for the rate calculation - K, M, G. if None, it auto-scales.
               _bar_width: width of the progress bar - minimum 10 characters, it the length is too much,
                         it is likely to run across the screen.
+              _bars([str]): bar for each count of completed characters, built once for the bar width
         """
 
         RUNNING = 1
         PAUSED = 2
         STOPPED = 3
 
+        # scale factors for the rate, largest first as looked up when auto-scaling
+        SCALES = (('G', 1e9), ('M', 1e6), ('K', 1e3))
+        SCALE_FACTORS = dict(SCALES)
+
         def __init__(self, label: str, itr_label: str = 'it/s', bar_width: int = 40, scale_factor=Optional[str],
                      maxvalue: int = 100, fmt: str = ''):
             """Initializes the instance of Progres bar
@@ -157,9 +184,9 @@ class Tui:
             self._itr_label = itr_label[:6]
             self._state = self.RUNNING
 
-            self._time = time.time_ns()
+            self._time = time.monotonic_ns()
 
-            if scale_factor not in [None, 'K', 'M', 'G']:
+            if scale_factor not in self.SCALE_FACTORS:
                 scale_factor = None
             self._scale_factor = scale_factor
 
@@ -168,44 +195,37 @@ class Tui:
             elif bar_width > 40:
                 bar_width = 40
             self._bar_width = bar_width
+            self._bars = ['#' * completed + '-' * (bar_width - completed) for completed in range(bar_width + 1)]
 
             if not fmt:
                 self._fmt = '{percentage:3.0f}%[{bar}]{value}/{total} : {rate} - {label}'
 
         def __str__(self) -> str:
             """Returns the string representative the current state of the progress bar"""
+            return self.render(time.monotonic_ns())
+
+        def render(self, now: int) -> str:
+            """Returns the string representative the state of the progress bar at monotonic time now (ns)"""
             percentage = (self._value / self._max) * 100
-            bar_completed = floor((self._value / self._max) * self._bar_width)
-            bar_remaining = self._bar_width - bar_completed
-            bar = '#' * bar_completed + '-' * bar_remaining
+            # max may have been lowered below value by set_max
+            bar = self._bars[min(floor((self._value / self._max) * self._bar_width), self._bar_width)]
 
-            delta = int(time.time_ns() - self._time)
-            # Avoid Div by Zero
-            if not delta:
+            # monotonic clock, wall clock may jump e.g. on NTP adjustments
+            delta = now - self._time
+            # Avoid Div by Zero, or a negative rate if reset after now was read
+            if delta <= 0:
                 delta = 1
-            rate = (self._value / delta) * 10e8
-
-            # auto-scale
-            factor = 1
-            scale_factor = ''
+            rate = self._value * 1_000_000_000 / delta
 
-            # if None, Autoscale
+            # if None, Autoscale - largest factor the rate is at least twice of, unscaled otherwise
             if self._scale_factor is None:
-                if rate > 10e3 * 2:
-                    scale_factor = 'K'
-                if rate > 10e6 * 2:
-                    scale_factor = 'M'
-                if rate > 10e9 * 2:
-                    scale_factor = 'G'
+                scale_factor, factor = '', 1
+                for scale in self.SCALES:
+                    if rate > 2 * scale[1]:
+                        scale_factor, factor = scale
+                        break
             else:
-                scale_factor = self._scale_factor
-
-            if scale_factor == 'K':
-                factor = 10e3
-            elif scale_factor == 'M':
-                factor = 10e6
-            elif scale_factor == 'G':
-                factor = 10e9
+                scale_factor, factor = self._scale_factor, self.SCALE_FACTORS[self._scale_factor]
 
             rate = round(rate / factor, 2)
             rate_str = str(rate) + scale_factor + self._itr_label
@@ -244,7 +264,27 @@ class Tui:
         def reset(self):
             """Resets the timer for rate calculation"""
             self._value = 0
-            self._time = time.time_ns()
+            self._time = time.monotonic_ns()
+
+    class __Rect(NamedTuple):
+        """ Internal class for layout of a window - height, width and origin (y, x) on top left corner """
+        h: int
+        w: int
+        y: int
+        x: int
+
+    class __Tab:
+        """ Internal class for a Tab, holds the content of tab - all tabs are painted on the shared _tab_win
+        Attributes:
+            buffer(deque): lines printed as tuple of (text, attribute), older lines are discarded beyond maxlen.
+                text is stored as given, each entry implicitly ends with a newline
+            cursor(int): count of lines from the start of buffer which are displayed, used for scrolling
+        """
+        __slots__ = ('buffer', 'cursor')
+
+        def __init__(self, maxlen: int):
+            self.buffer = deque(maxlen=maxlen)
+            self.cursor = 0
 
     class __Commands:
         """ Internal class related to command(s)
@@ -252,14 +292,19 @@ class Tui:
             current(str): current command being typed by the user, could be for prompt or shell.
             prompt(str): the prompt shown before uer input
 
-            _history([str]): list holds all previous commands executed
-            _registered({}): array of registered commands where key is command and value is the function being invoked
+            _buffer([str]): characters of the current command, joined only when current is read
+            _history(deque): holds previous commands executed, bounded to HISTORY_LENGTH
+            _registered({}): registered commands where key is command and value is tuple of the function being invoked,
+                its tooltip and the (minimum, maximum) count of arguments it accepts
             _mode(bool) : sets whether input should be in clear or masked, e.g. for passwords
             _cursor(int): reference for where to print input from if the input exceed screen width
         """
         CMD_MODE_NORMAL = False
         CMD_MODE_PASSWORD = True
 
+        # commands retained in history, older ones are discarded
+        HISTORY_LENGTH = 1000
+
         def __init__(self, instance):
             """
             Basic Init
@@ -270,14 +315,46 @@ class Tui:
             assert isinstance(instance, Tui)
 
             self.tui = instance
-            self.current = ''
+            self._buffer = []
             self.prompt = ''
 
-            self._history = []
+            self._history = deque(maxlen=self.HISTORY_LENGTH)
             self._registered = {}
             self._mode = self.CMD_MODE_NORMAL
             self._cursor = 0
 
+        @property
+        def current(self) -> str:
+            """return the command being typed"""
+            return ''.join(self._buffer)
+
+        @current.setter
+        def current(self, command: str):
+            """replace the command being typed"""
+            self._buffer = list(command)
+
+        def visible(self, start: int, width: int) -> str:
+            """return width characters of the command being typed from start, only that portion is joined"""
+            return ''.join(self._buffer[start:start + width])
+
+        def append(self, c: str):
+            """Append character(s) to the command being typed"""
+            self._buffer.append(c)
+
+        def backspace(self):
+            """Remove the last character of the command being typed"""
+            if self._buffer:
+                self._buffer.pop()
+
+        def clear(self):
+            """Clear the command being typed"""
+            self._buffer.clear()
+
+        @property
+        def length(self) -> int:
+            """return length of the command being typed, without joining it"""
+            return len(self._buffer)
+
         def register_command(self, command_name: str, function, tooltip=''):
             """Registers command - command_name invokes function"""
             if command_name.strip() == '':
@@ -287,18 +364,32 @@ class Tui:
                 self.tui.INFO(f'Registering duplicate command {command_name}, Ignored')
                 return
             else:
-                self._registered[command_name] = (function, tooltip)
+                self._registered[command_name] = (function, tooltip, self._arity(function))
+
+        @staticmethod
+        def _arity(function) -> (int, Optional[int]):
+            """Returns (minimum, maximum) count of positional arguments of function, maximum is None if unbounded"""
+            minimum = maximum = 0
+            for param in inspect.signature(function).parameters.values():
+                if param.kind == param.VAR_POSITIONAL:
+                    return minimum, None
+                if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                    maximum += 1
+                    if param.default is param.empty:
+                        minimum += 1
+            return minimum, maximum
 
         def get_command(self, command_name: str):
             """Returns corresponding function registered against given command_name"""
-            command_name = command_name.strip()
-            if not command_name:
+            entry = self._registered.get(command_name.strip())
+            if entry is None:
                 return None
 
-            if command_name not in self._registered:
-                return None
+            return entry[0]
 
-            return self._registered[command_name][0]
+        def get_arity(self, command_name: str) -> (int, Optional[int]):
+            """Returns (minimum, maximum) count of arguments accepted by the command, computed once on registration"""
+            return self._registered[command_name.strip()][2]
 
         def get_hints(self) -> []:
             """gets commands and respective hints"""
@@ -336,8 +427,8 @@ class Tui:
             return self._mode
 
         @property
-        def history(self) -> []:
-            """Return list of commands"""
+        def history(self) -> deque:
+            """Return commands executed, oldest first"""
             return self._history
 
         def add_history(self, command: str):
@@ -348,6 +439,17 @@ class Tui:
 
     BOX_WIDTH = 1
 
+    # lines retained per tab, older lines are discarded
+    BUFFER_LINES = 10000
+
+    # seconds between resource utilisation samples, disk usage changes slowly and is sampled every nth time only
+    RES_UTIL_INTERVAL = 2
+    RES_UTIL_DISK_EVERY = 15
+
+    # milliseconds getkey waits for a key - while keys or output keep coming, and when idle
+    GETKEY_TIMEOUT_ACTIVE = 10
+    GETKEY_TIMEOUT_IDLE = 100
+
     PROMPT_YESNO = 1
     PROMPT_INPUT = 2
     PROMPT_OPTIONS = 3
@@ -393,14 +495,27 @@ class Tui:
         self._banner = banner[:banner_trim]
 
         # Set up the for running the __res_util as a parallel thread
-        self._psutil = self.__Lockable(str)
+        self._psutil = ''
+        self._res_util_stop = threading.Event()
         threading.Thread(target=self._res_util, daemon=True).start()
 
-        # collection of tabs - tuple of name, window, buffer, cursor position
+        # collection of tabs - name mapped to __Tab
         self._tabs = {}
+        self._active_tab_name = None
+        self._tab_dirty = True
 
-        # footer defined separately
+        # window shared by all tabs and the rows printed on it on the last paint
+        self._tab_win = None
+        self._tab_shadow = []
+
+        # footer defined separately, static parts of it (box, prompt) are only drawn when needed
         self._footer = None
+        self._footer_drawn = False
+        self._prompt_drawn = None
+        self._status_drawn = None
+        self._tabstrip_drawn = False
+        self._footer_dirty = True
+        self._cmdline_dirty = True
 
         # internal flag to trigger TUI/Application Exit
         self._quit = False
@@ -412,14 +527,17 @@ class Tui:
 
         self._prompt_lock = threading.Lock()
         self._shell_lock = threading.Lock()
-        self._print_lock = threading.Lock()
         self._refresh_lock = threading.Lock()
-        self._log_lock = threading.Lock()
+        self._buffer_lock = threading.Lock()
         self._widget_lock = threading.Lock()
 
+        # handlers of the control keys, any other key is part of the command being typed
+        self._key_handlers = {'KEY_UP': self._key_up, 'KEY_DOWN': self._key_down,
+                              'KEY_RIGHT': self._key_right, 'KEY_LEFT': self._key_left,
+                              'KEY_BACKSPACE': self._key_backspace, '\t': self._enable_next_tab, '\n': self._key_enter}
+
         # setting up dispatch queue for handling keystrokes
         self._dispatch_queue = queue.LifoQueue()
-        self._input_queue = queue.LifoQueue()
 
         # For running list of widget
         self._widget = {}
@@ -452,9 +570,8 @@ class Tui:
         try:
             assert self._footer_height >= 5, 'TUI: Malformed Footer Size'
             assert self._footer is not None, 'TUI: Footer not defined'
-            assert len([tab for tab in self._tabs if tab in ['console', 'log']]) == 2, 'TUI: Mandatory tabs missing'
-            assert len([self._tabs[tab] for tab in self._tabs if self._tabs[tab]['selected']]) == 1, \
-                'TUI: Tab not activated correctly'
+            assert {'console', 'log'} <= self._tabs.keys(), 'TUI: Mandatory tabs missing'
+            assert self._active_tab_name in self._tabs, 'TUI: Tab not activated correctly'
         except AssertionError as e:
             self._shutdown()
             print(f'TUI: Setup configuration is wrong: {e}')
@@ -463,8 +580,9 @@ class Tui:
         self.INFO("Initialising TUI environment")
         self._refresh()
 
-        # Register the signal handler for SIGINT (Ctrl+C)
+        # Register the signal handler for SIGINT (Ctrl+C), and restore the terminal on any exit as safety net
         signal.signal(signal.SIGINT, self._shutdown)
+        atexit.register(self._shutdown)
 
         self._cmd.register_command('clear', self.clear, 'Clears console tab, alternative tab name/all can be specified')
         self._cmd.register_command('demo', self.demo, 'Demonstrates inbuilt widgets & functions of TUI')
@@ -477,20 +595,60 @@ class Tui:
         threading.Thread(target=self.shell, daemon=True).start()
 
     def _refreshfooter(self):
-        """_refreshfooter() - prints the footer section on each call"""
+        """_refreshfooter() - prints the footer section on each call, staged for the next curses.doupdate"""
 
         tab_tooltip = "Use Tab key to rotate through Tabs"
         tab_prefix = 'Tabs:'
-        tab_psutil = self._psutil.value
-
-        # print tab list & tooltip
-        self._footer.erase()
-        self._footer.bkgd(curses.color_pair(self.COLOR_FOOTER))
-        self._footer.box()
-        self._footer.addstr(2, self._resolution['x'] - len(tab_tooltip) - self.BOX_WIDTH, tab_tooltip)
-        self._footer.addstr(3, self._resolution['x'] - len(tab_psutil) - self.BOX_WIDTH, tab_psutil, curses.A_BOLD)
-
-        self._footer.addstr(3, self.BOX_WIDTH, self._banner, curses.A_BOLD)
+        tab_psutil = self._psutil
+
+        # Each footer line is assembled as one row padded to the usable width and written with a single addnstr,
+        # attributes are then applied on the required runs with chgat
+        row_width = self._footer_width
+        footer_attr = self._attr_footer
+
+        # rows are always written padded to full width, hence no erase is needed and the
+        # box is only drawn once for a new footer window
+        if not self._footer_drawn:
+            self._footer.bkgd(footer_attr)
+            self._footer.box()
+            self._footer_drawn = True
+            self._prompt_drawn = None
+            self._status_drawn = None
+
+        # banner on the left, resource utilisation on the right, re-printed only if either of them changed
+        status = (self._banner, tab_psutil)
+        if status != self._status_drawn:
+            row = self._banner.ljust(row_width - len(tab_psutil))[:row_width - len(tab_psutil)] + tab_psutil
+            self._footer.addnstr(3, self.BOX_WIDTH, row, row_width, curses.A_BOLD)
+            self._status_drawn = status
+
+        self._refreshcmdline()
+
+        # tab strip only changes on activation or with a new footer window, it is not re-printed otherwise
+        if not self._tabstrip_drawn:
+            self._tabstrip_drawn = True
+
+            # Build the complete tab strip in one pass, trimmed so that it does not run into the tooltip
+            tab_labels = [''.join([' | ', tab, ' | ']) for tab in self._tabs]
+            tab_width = row_width - len(tab_tooltip) - len(tab_prefix)
+            tab_strip = ''.join(tab_labels)[:tab_width - 1]
+            row = (tab_prefix + tab_strip).ljust(row_width - len(tab_tooltip)) + tab_tooltip
+            self._footer.addnstr(2, self.BOX_WIDTH, row, row_width)
+
+            # Highlight only the selected label
+            index = self.BOX_WIDTH + len(tab_prefix)
+            for tab, label in zip(self._tabs, tab_labels):
+                if tab == self._active_tab_name:
+                    length = min(len(label), self.BOX_WIDTH + len(tab_prefix) + len(tab_strip) - index)
+                    if length > 0:
+                        self._footer.chgat(2, index, length, curses.A_REVERSE | footer_attr)
+                    break
+                index += len(label)
+
+        self._footer.noutrefresh()
+
+    def _refreshcmdline(self):
+        """_refreshcmdline() - prints the commandline in the footer, the prompt is only re-printed if it changed"""
 
         # Displaying scrollable commandline
         # Usable space = screen width - 2 * BOX_WIDTH
@@ -498,67 +656,136 @@ class Tui:
         # Less command prompt should be trimmed to 50% of the available space
         # Remain Command should be scrollable, cursor position defines from where the command is printed
 
-        width = self._resolution['x'] - 2 * self.BOX_WIDTH
+        width = self._footer_width
 
         # Trim to maximum length of 50% width
         cmd_prompt = self.CMD_PROMPT[:floor(width / 2)]
+        if cmd_prompt != self._prompt_drawn:
+            self._footer.addstr(1, self.BOX_WIDTH, cmd_prompt + ' ')
+            self._prompt_drawn = cmd_prompt
+        cmd_x = self.BOX_WIDTH + len(cmd_prompt) + 1
 
         # Available width - less length of cmd prompt and two (one for seperator, and another cursor)
         width = width - len(cmd_prompt) - 2
 
-        # build cmd
+        # build portion of cmd relative to cursor position, a long command is never joined as a whole
         if not self._cmd.is_masked():
-            cmd = self._cmd.current
+            cmd = self._cmd.visible(self._cmd.cursor, width)
         else:  # CMD_MODE_PASSWORD
-            cmd = '*' * len(self._cmd.current)
-
-        # Select portion of string relative to cursor position
-        cmd = cmd[self._cmd.cursor:width + self._cmd.cursor]
-
-        # Print <prompt><space><strip of cmd><blinking underscore as prompt>
-        command_string = ''.join([cmd_prompt, ' ', cmd])
-        self._footer.addstr(1, self.BOX_WIDTH, command_string)
-        self._footer.addstr('_', curses.A_BLINK | curses.A_BOLD)
-        self._footer.addstr(2, self.BOX_WIDTH, tab_prefix)
-        index = self.BOX_WIDTH + len(tab_prefix)
-
-        for tab in self._tabs:
-            label = ''.join([' | ', tab, ' | '])
-            if self._tabs[tab]['selected']:
-                self._footer.addstr(2, index, label, curses.A_REVERSE)
-            else:
-                self._footer.addstr(2, index, label)
-            index += len(label)
-
-        self._footer.refresh()
+            cmd = _mask(max(0, min(width, self._cmd.length - self._cmd.cursor)))
+
+        # Print <strip of cmd><blinking underscore as prompt>, padded to overwrite the previous command
+        self._footer.addnstr(1, cmd_x, (cmd + '_').ljust(width + 1), width + 1)
+        self._footer.chgat(1, cmd_x + len(cmd), 1, self._attr_cursor)
+
+    @staticmethod
+    def _wraprows(text, attribute, width) -> []:
+        """_wraprows() - splits text into rows of (text, attribute) of given width, the way the window would wrap it"""
+        rows = []
+        for line in text.expandtabs().split('\n'):
+            rows.extend([(line[i:i + width], attribute) for i in range(0, len(line), width)] or [('', attribute)])
+        return rows
+
+    @staticmethod
+    def _scrollshift(shadow, rows) -> int:
+        """_scrollshift() - rows the previous paint has to scroll to match the new one, positive is up, 0 if none"""
+        height = len(shadow)
+        if height != len(rows):
+            return 0
+
+        for shift in range(1, height):
+            # output appended pushes the rows up
+            if rows[0] is not None and shadow[shift] == rows[0] and shadow[shift:] == rows[:height - shift]:
+                return shift
+            # scrolling back through the buffer pushes the rows down
+            if shadow[0] is not None and rows[shift] == shadow[0] and rows[shift:] == shadow[:height - shift]:
+                return -shift
+        return 0
+
+    def _refreshtab(self, force=False) -> bool:
+        """_refreshtab() - Refresh/Re-paint the active tab, only rows changed since the last paint are re-printed
+        Args:
+            force(bool): re-print all rows
+        Returns:
+            False if the rows were unchanged and nothing was painted
+        """
 
-    def _refreshtab(self):
-        """_refreshtab() - Refresh/Re-paint the active tab"""
+        # reset before painting, anything appended while painting will mark it dirty again
+        self._tab_dirty = False
 
         # printing the Active tab only
         active_tab = self._activetab
+        buffer = active_tab.buffer
+        window = self._tab_win
+        shadow = [] if force else self._tab_shadow
 
-        # logic implements scrolling find minimum of curser and number of lines in buffer,
-        # to avoid it scrolling past the buffer with lines less than screen height
-        buffer = active_tab['buffer']
-        window = active_tab['win']
-        cursor = min(active_tab['cursor'], len(buffer))
-        window.erase()
-        for i in range(cursor):
-            line = buffer[i]
-            window.addstr(line[0], line[1])
+        # last row is left empty, as it would be by the newline of the last line in a scrolling window
+        height = self._tab_coordinates.h - 1
+        width = self._tab_coordinates.w
 
+        # widgets and buffer lines are only snapshotted under their locks, formatting and wrapping is done after
+        # release so that threads updating a widget or appending a message are not held up by the paint
         with self._widget_lock:
-            for widget in self._widget:
-                line = ''.join([str(self._widget[widget]), '\n'])
-                window.addstr(line, curses.A_BOLD)
+            widgets = list(self._widget.values())
+
+        # logic implements scrolling find minimum of curser and number of lines in buffer,
+        # to avoid it scrolling past the buffer with lines less than screen height
+        # buffer cannot be appended to while iterated, each line is at least one row hence no more than height are needed
+        with self._buffer_lock:
+            cursor = min(active_tab.cursor, len(buffer))
+            lines = list(islice(reversed(buffer), len(buffer) - cursor, len(buffer) - cursor + height))
+
+        # collect visible rows bottom up - widgets first, then the buffer backwards from the cursor
+        rows = []
+        # clock is read once for all widgets of the frame
+        now = time.monotonic_ns()
+        for widget in reversed(widgets):
+            rows.extend(reversed(self._wraprows(widget.render(now), curses.A_BOLD, width)))
+        for message, attribute in lines:
+            if len(rows) >= height:
+                break
+            rows.extend(reversed(self._wraprows(message, attribute, width)))
+
+        rows = rows[:height]
+        rows.reverse()
+        rows.extend([None] * (height - len(rows)))
+
+        # e.g. widgets are re-collected on every refresh, but animate only every so often
+        if rows == shadow:
+            return False
+
+        # appended lines push the previous rows up, move the viewport by scrolling the window content so that only
+        # the newly exposed rows are printed instead of all of them
+        shift = self._scrollshift(shadow, rows)
+        if shift > 0:
+            window.scroll(shift)
+            shadow = shadow[shift:] + [None] * shift
+        elif shift < 0:
+            window.scroll(shift)
+            shadow = [None] * -shift + shadow[:shift]
+            # the last row is kept empty, but scrolling down moves a painted row into it
+            window.move(height, 0)
+            window.clrtoeol()
+
+        # re-print only rows which differ from the previous paint
+        for row, line in enumerate(rows):
+            if row < len(shadow) and shadow[row] == line:
+                continue
+            window.move(row, 0)
+            window.clrtoeol()
+            if line is not None:
+                window.addnstr(row, 0, line[0], width, line[1])
 
-        window.refresh()
+        self._tab_shadow = rows
+        window.noutrefresh()
+        return True
 
-    def _refresh(self, force=False):
-        """_refresh() - refreshes all windows
+    def _refresh(self, force=False) -> bool:
+        """_refresh() - refreshes the footer, and the active tab only if its content has changed
         Args:
             force(bool): forces complete screen refresh
+        Returns:
+            True if anything was painted
         """
         if curses.is_term_resized(self._resolution['y'], self._resolution['x']):
             self._shutdown()
@@ -567,41 +794,74 @@ class Tui:
             self._create_windows()
             force = True
 
+        # the footer is only partially re-printed, clear the screen on its refresh to repaint everything
         if force:
-            self._stdscr.touchwin()
+            self._footer.clearok(True)
 
         with self._refresh_lock:
-            self._refreshfooter()
-            self._refreshtab()
+            # windows are only staged with noutrefresh, the terminal is updated once for all of them
+            painted = True
+
+            # keystrokes only change the commandline, the rest of the footer is re-printed only when marked dirty
+            if force or self._footer_dirty:
+                self._footer_dirty = False
+                self._cmdline_dirty = False
+                self._refreshfooter()
+            elif self._cmdline_dirty:
+                self._cmdline_dirty = False
+                self._refreshcmdline()
+                self._footer.noutrefresh()
+            else:
+                painted = False
+
+            # widgets however animate on their own
+            if (force or self._tab_dirty or self._widget) and self._refreshtab(force):
+                painted = True
+
+            if painted:
+                # written straight to the terminal, doupdate flushes its own output before returning
+                os.write(sys.stdout.fileno(), _SYNC_BEGIN)
+                curses.doupdate()
+                os.write(sys.stdout.fileno(), _SYNC_END)
 
-            # not sure if this is needed, both _refreshtab & _refreshfooter calls individual window.refresh()
-            self._stdscr.refresh()
+            return painted
 
     @property
-    def _activetab(self) -> {}:
-        """_activetab - returns tab marked as 'selected'"""
-        active_tab = [self._tabs[tab] for tab in self._tabs if self._tabs[tab]['selected']]
-        if len(active_tab) != 1:
-            self.ERROR('TUI: Active State for tabs inconsistent')
-        active_tab = active_tab[0]
-        return active_tab
+    def _activetab(self) -> __Tab:
+        """_activetab - returns the tab activated last, name is validated in _activate"""
+        return self._tabs[self._active_tab_name]
 
     def _res_util(self):
-        """_res_util - maintains the _psutil.value string giving the resource utilisation, will run as infinite loop """
-        while True:
-            # Get CPU usage as a percentage - currently on static interval of 2 secs
-            cpu_percent = psutil.cpu_percent(interval=2)
+        """_res_util - maintains the _psutil string giving the resource utilisation, runs till _res_util_stop"""
+        # a short blocking first sample gives figures for the first footer paints and primes cpu_percent, which
+        # without interval does not block and gives usage since its previous call
+        cpu_percent = psutil.cpu_percent(interval=0.1)
+        disk_percent = psutil.disk_usage('/').percent
+        sample = 0
+        figures = None
 
+        while True:
             # Get memory usage statistics
             mem = psutil.virtual_memory()
             mem_percent = mem.percent
 
-            # Get disk usage statistics
-            disk = psutil.disk_usage('/')
-            disk_percent = disk.percent
+            # String for results is only formatted, and footer re-painted, if the figures changed. It is only ever
+            # replaced by a single reference store, which readers see whole without a lock
+            if figures != (cpu_percent, mem_percent, disk_percent):
+                figures = (cpu_percent, mem_percent, disk_percent)
+                self._psutil = f'CPU: {cpu_percent}% RAM: {mem_percent}% Disk(/): {disk_percent}%'
+                self._footer_dirty = True
+
+            if self._res_util_stop.wait(self.RES_UTIL_INTERVAL):
+                break
+
+            # Get CPU usage as a percentage since the last sample
+            cpu_percent = psutil.cpu_percent(interval=None)
 
-            # String for results, operation is atomic internally
-            self._psutil.value = f'CPU: {cpu_percent}% RAM: {mem_percent}% Disk(/): {disk_percent}%'
+            # Get disk usage statistics, last value is reused in between
+            sample += 1
+            if sample % self.RES_UTIL_DISK_EVERY == 0:
+                disk_percent = psutil.disk_usage('/').percent
 
     def _activate(self, name):
         """_activate - mark 'name' as active tab"""
@@ -609,39 +869,37 @@ class Tui:
             self.ERROR('TUI: Activating non available Tab')
             return
 
-        for tab in self._tabs:
-            self._tabs[tab]['selected'] = False
+        self._active_tab_name = name
+        self._tabstrip_drawn = False
 
-        self._tabs[name]['selected'] = True
-
-        # forces refresh to repaint tab and footer
-        self._refresh()
+        # window content is of the previously active tab on screen, re-print all rows
+        self._tab_shadow = []
+        # repaint tab and footer on next refresh
+        self._tab_dirty = True
+        self._footer_dirty = True
 
     def _resizeScreen(self):
         """_resizeScreen - recalculate layout (width, height, origin y, origin x) with origin on top left corner"""
         curses.update_lines_cols()
         self._resolution = {'x': curses.COLS, 'y': curses.LINES}
-        self._tab_coordinates = {'h': self._resolution['y'] - self._footer_height, 'w': self._resolution['x'],
-                                 'y': 0, 'x': 0}
-        self._footer_coordinates = {'h': self._footer_height, 'w': self._resolution['x'],
-                                    'y': self._resolution['y'] - self._footer_height, 'x': 0}
+        self._tab_coordinates = self.__Rect(self._resolution['y'] - self._footer_height, self._resolution['x'], 0, 0)
+        self._footer_coordinates = self.__Rect(self._footer_height, self._resolution['x'],
+                                               self._resolution['y'] - self._footer_height, 0)
+
+        # usable width within the footer box, used on every footer paint and key stroke
+        self._footer_width = self._resolution['x'] - 2 * self.BOX_WIDTH
 
     def _log(self, severity, message):
         """_log - the parent function to add text to log tab, severity determines the attribute"""
 
-        assert (severity in [self.SEVERITY_ERROR, self.SEVERITY_WARNING, self.SEVERITY_INFO]), \
-            f'TUI: Incorrect Severity {severity} defined'
-
-        with self._log_lock:
-            attribute = curses.color_pair(self.COLOR_NORMAL)
-            if severity == self.SEVERITY_ERROR:
-                attribute = curses.color_pair(self.COLOR_ERROR)
-            elif severity == self.SEVERITY_WARNING:
-                attribute = curses.color_pair(self.COLOR_WARNING)
+        # severity is validated by the lookup itself, an unknown one raises KeyError with or without -O
+        attribute = self._attr_severity[severity]
 
+        with self._buffer_lock:
             logger = self._tabs['log']
-            logger['buffer'].append((message + '\n', attribute))
-            logger['cursor'] = len(logger['buffer'])
+            logger.buffer.append((message, attribute))
+            logger.cursor = len(logger.buffer)
+            self._tab_dirty = True
 
     def _create_windows(self):
         """_build_windows - creates the _footer and _tab windows, discards old windows"""
@@ -650,12 +908,22 @@ class Tui:
             self._footer = None
 
         # creating footer, Cant create tab before that
-        self._footer = curses.newwin(self._footer_coordinates['h'], self._footer_coordinates['w'],
-                                     self._footer_coordinates['y'], self._footer_coordinates['x'])
+        self._footer = curses.newwin(*self._footer_coordinates)
+        self._footer_drawn = False
+        self._tabstrip_drawn = False
+
+        # stdscr is not painted on, but its first refresh clears the screen (getkey also refreshes it if touched),
+        # stage it before any of the windows, the clear is then sent with the first update of the screen
+        self._stdscr.noutrefresh()
+
+        # single window shared by the tabs, only the active tab is painted on it
+        self._tab_win = curses.newwin(*self._tab_coordinates)
+        self._tab_shadow = []
 
-        if self._tabs:
-            self._tabs.clear()
+        # Enabling Scrolling
+        self._tab_win.scrollok(True)
 
+        # tabs hold no window, their content is retained when windows are re-created on resize
         for tab_name in ['console', 'log']:
             name = tab_name.strip()
 
@@ -663,16 +931,22 @@ class Tui:
             if not name or name in self._tabs:
                 continue
 
-            # Tab is a tuple of name, window, buffer, cursor position, and selected state
-            self._tabs[name] = {'win': curses.newwin(self._tab_coordinates['h'], self._tab_coordinates['w'],
-                                                     self._tab_coordinates['y'], self._tab_coordinates['x']),
-                                'buffer': [], 'cursor': 0, 'selected': True}
+            self._tabs[name] = self.__Tab(self.BUFFER_LINES)
 
-            # Enabling Scrolling
-            self._tabs[name]['win'].scrollok(True)
+    def _shutdown(self, signum=None, frame=None):
+        """_shutdown - shuts down the curses environment, also the SIGINT handler and atexit hook
+        Args:
+            signum(int): signal number when invoked as signal handler, None otherwise
+            frame: current stack frame when invoked as signal handler, unused
+        """
+        # as signal handler the application is interrupted - stop the main loop and sampling, after restoring
+        # the terminal the interrupt is raised as without the handler
+        if signum is not None:
+            self._quit = True
+            self._res_util_stop.set()
+            self._shutdown()
+            raise KeyboardInterrupt
 
-    def _shutdown(self):
-        """_shutdown - shuts down the curses environment"""
         # if not previously setup - skip
         if not self._is_setup:
             return
@@ -730,8 +1004,19 @@ class Tui:
         curses.init_pair(self.COLOR_HIGHLIGHT, self.highlightColor, self.bgColor)
         curses.init_pair(self.COLOR_FOOTER, self.fgColor, self.bgFooter)
 
-        # no waiting on getch()
-        self._stdscr.nodelay(True)
+        # attributes of the color pairs are looked up once, instead of on every print and paint
+        self._attr_normal = curses.color_pair(self.COLOR_NORMAL)
+        self._attr_highlight = curses.color_pair(self.COLOR_HIGHLIGHT)
+        self._attr_footer = curses.color_pair(self.COLOR_FOOTER)
+        self._attr_severity = {self.SEVERITY_ERROR: curses.color_pair(self.COLOR_ERROR),
+                               self.SEVERITY_WARNING: curses.color_pair(self.COLOR_WARNING),
+                               self.SEVERITY_INFO: self._attr_normal}
+        # commandline cursor, re-applied on every key stroke
+        self._attr_cursor = curses.A_BLINK | curses.A_BOLD | self._attr_footer
+
+        # getkey waits a short while for a key, instead of blocking till one is pressed
+        self._getkey_timeout = self.GETKEY_TIMEOUT_ACTIVE
+        self._stdscr.timeout(self._getkey_timeout)
 
         # END ncurses startup/initialization...
         self._is_setup = True
@@ -744,20 +1029,105 @@ class Tui:
 
     def _enable_next_tab(self):
         """enable_next_tab: Finds and enables next tab, rotates to first if we reach the end"""
-        active_tab = [tab for tab in self._tabs if self._tabs[tab]['selected']]
-        if len(active_tab) != 1:
-            self.ERROR('TUI: More than one tab active')
-
         tab_list = list(self._tabs)
 
         # select next tab on the dict
         try:
-            next_tab = tab_list[tab_list.index(active_tab[0]) + 1]
+            next_tab = tab_list[tab_list.index(self._active_tab_name) + 1]
         except (ValueError, IndexError):
             next_tab = tab_list[0]
 
         self._activate(next_tab)
 
+    def _cmdwidth(self) -> int:
+        """_cmdwidth - width available to the command being typed, the same way _refreshcmdline lays it out"""
+        width = self._footer_width
+        return width - len(self.CMD_PROMPT[:floor(width / 2)]) - 2
+
+    def _key_up(self):
+        """_key_up - scrolls the active tab up, only if content exceeds the screen size"""
+        activetab = self._activetab
+        if activetab.cursor > self._tab_coordinates.h:
+            activetab.cursor -= 1
+            self._tab_dirty = True
+
+    def _key_down(self):
+        """_key_down - scrolls the active tab down, till the last line"""
+        activetab = self._activetab
+        activetab.cursor = min(len(activetab.buffer), activetab.cursor + 1)
+        self._tab_dirty = True
+
+    def _key_right(self):
+        """_key_right - scrolls the commandline right"""
+        width = self._cmdwidth()
+        # Only if the input is greater than the available space is cursor position relevant
+        if self._cmd.length > width:
+            if self._cmd.cursor < self._cmd.length - width:
+                self._cmd.inc_cursor()
+
+    def _key_left(self):
+        """_key_left - scrolls the commandline left"""
+        self._cmd.dec_cursor()
+
+    def _key_backspace(self):
+        """_key_backspace - removes the last character of the command being typed"""
+        self._cmd.backspace()
+        if self._cmd.cursor > 0:
+            self._cmd.dec_cursor()
+
+    def _key_enter(self):
+        """_key_enter - hands the completed command over to the waiting shell/prompt"""
+        # if nothing is waiting in queue don't process any keys
+        if self._dispatch_queue.empty():
+            return
+
+        # Command has been completed
+        command = self._cmd.current
+        if command.strip():
+            self._cmd.add_history(command)
+            try:
+                slot = self._dispatch_queue.get_nowait()
+            except queue.Empty:
+                self.ERROR('TUI: Nothing in dispatch queue')
+                return
+
+            # wakes up the most recent waiting shell/prompt
+            slot.put(command)
+
+        self._cmd.clear()
+        self._cmd.reset_cursor()
+
+    def _handlekey(self, c):
+        """_handlekey - processes a single key, only updates state and marks what needs to be re-painted"""
+
+        # any key may change the commandline
+        self._cmdline_dirty = True
+
+        # control keys - scrolling (KEY_UP, KEY_DOWN for tab, KEY_RIGHT, KEY_LEFT for commandline), editing, Tab key
+        # circles through available tabs and newline completes the command
+        handler = self._key_handlers.get(c)
+        if handler is not None:
+            handler()
+            return
+
+        # Simple hack - if it is longer than a char it is a special
+        # key string that we care not currently handling
+        if len(c) > 1:
+            return
+
+        # here onwards we are processing keys outside control keys
+        # if nothing is waiting in queue don't process any keys
+        if self._dispatch_queue.empty():
+            return
+
+        # if we are here, c is a valid part of the command being typed, append to it and increment the cursor
+        self._cmd.append(c)
+        width = self._cmdwidth()
+        # Only if the input is greater than the available space is cursor position relevant
+        if self._cmd.length > width:
+            if self._cmd.cursor < self._cmd.length - width:
+                self._cmd.inc_cursor()
+
     def run(self):
         """run - The main thread which is accepting and dispatches keys"""
         if not self._is_setup:
@@ -769,94 +1139,22 @@ class Tui:
 
         # main loop
         while not self._quit:
-            # wait 10ms to avoid 100% CPU usage
-            curses.napms(10)
-
-            self._refresh()
-
-            # get input
+            # pending keys are returned without waiting, the screen is only painted once getkey times out with no
+            # key pending - a paste or key repeat results in a single refresh, and idle wait is done by getkey itself
             try:
                 c = self._stdscr.getkey()
             except curses.error:
-                c = None
-
-            if c is not None:
-
-                activetab = self._activetab
-
-                # KEY_UP & KEY_DOWN are only for scrolling, cannot be passed to command
-                # If screen content < screen size - do not scroll
-                if c == 'KEY_UP':
-                    if activetab['cursor'] > self._tab_coordinates['h']:
-                        activetab['cursor'] -= 1
-                        continue
-                elif c == 'KEY_DOWN':
-                    activetab['cursor'] = min(len(activetab['buffer']), activetab['cursor'] + 1)
-                    continue
-
-                # KEY_RIGHT & KEY_LEFT are only for scrolling commandline
-                elif c == 'KEY_RIGHT':
-                    width = self._resolution['x'] - 2 * self.BOX_WIDTH
-                    width = width - len(self.CMD_PROMPT[:floor(width / 2)]) - 2
-                    # Only if the input is greater than the available space is cursor position relevant
-                    if len(self._cmd.current) > width:
-                        if self._cmd.cursor < len(self._cmd.current) - width:
-                            self._cmd.inc_cursor()
-                elif c == 'KEY_LEFT':
-                    self._cmd.dec_cursor()
-
-                # handler for other keys
-                elif c == 'KEY_BACKSPACE':
-                    self._cmd.current = self._cmd.current[:-1]
-                    if self._cmd.cursor > 0:
-                        self._cmd.dec_cursor()
-                    continue
-
-                # Tab key circles through available tabs
-                elif c == '\t':
-                    # switch to next 'Tab' on Alt
-                    self._enable_next_tab()
-                    continue
+                # wait longer while there is nothing to paint, shorter again once there is
+                timeout = self.GETKEY_TIMEOUT_ACTIVE if self._refresh() else self.GETKEY_TIMEOUT_IDLE
+                if timeout != self._getkey_timeout:
+                    self._getkey_timeout = timeout
+                    self._stdscr.timeout(timeout)
+                continue
 
-                # Simple hack - if it is longer than a char it is a special
-                # key string that we care not currently handling
-                if len(c) > 1:
-                    continue
+            self._handlekey(c)
 
-                # here onwards we are processing keys outside control keys
-                # if nothing is waiting in queue don't process any keys
-                if self._dispatch_queue.empty():
-                    continue
-
-                # Newline received, based on data input mode the dispatch sequence is identified
-                if c == '\n':
-                    # Command has been completed
-                    if self._cmd.current.strip():
-                        self._input_queue.put(self._cmd.current)
-                        self._cmd.add_history(self._cmd.current)
-                        try:
-                            condition = self._dispatch_queue.get()
-                        except queue.Empty:
-                            self.ERROR('TUI: Nothing in dispatch queue')
-                            continue
-
-                        with condition:
-                            condition.notify()
-
-                    self._cmd.current = ''
-                    self._cmd.reset_cursor()
-
-                # if we are here, c is a valid part of the command being typed, append to it and increment the cursor
-                else:
-                    self._cmd.current = ''.join([self._cmd.current, c])
-                    width = self._resolution['x'] - 2 * self.BOX_WIDTH
-                    width = width - len(self.CMD_PROMPT[:floor(width / 2)]) - 2
-                    # Only if the input is greater than the available space is cursor position relevant
-                    if len(self._cmd.current) > width:
-                        if self._cmd.cursor < len(self._cmd.current) - width:
-                            self._cmd.inc_cursor()
-
-        # broken out of the loop - clean up
+        # broken out of the loop - clean up, _shutdown alone is also used on resize and leaves the sampling running
+        self._res_util_stop.set()
         self._shutdown()
 
     def INFO(self, message):
@@ -877,13 +1175,14 @@ class Tui:
             message(str): The message to print, adds newline character on print
             attribute: the attribute for the text, uses COLOR_NORMAL as default
         """
-        with self._print_lock:
-            if attribute is None:
-                attribute = curses.color_pair(self.COLOR_NORMAL)
-            console = self._tabs['console']
+        if attribute is None:
+            attribute = self._attr_normal
 
-            console['buffer'].append((''.join([message, '\n']), attribute))
-            console['cursor'] = len(console['buffer'])
+        with self._buffer_lock:
+            console = self._tabs['console']
+            console.buffer.append((message, attribute))
+            console.cursor = len(console.buffer)
+            self._tab_dirty = True
 
     def clear(self, name):
         """clear - Clear the named tab
@@ -891,20 +1190,22 @@ class Tui:
             name(str): the 'tab' to clear, all specifies all tabs
         """
 
-        if name == 'all':
-            for tab in self._tabs:
-                self._tabs[tab]['buffer'] = []
-                self._tabs[tab]['cursor'] = 0
-        elif name in self._tabs:
-            self._tabs[name]['buffer'] = []
-            self._tabs[name]['cursor'] = 0
-        else:
+        if name != 'all' and name not in self._tabs:
             self.print(f'Attempted to clear non-existent tab {name}')
+            return
+
+        with self._buffer_lock:
+            for tab in self._tabs if name == 'all' else [name]:
+                self._tabs[tab].buffer.clear()
+                self._tabs[tab].cursor = 0
+
+        self._tab_dirty = True
 
     def history(self):
         """history - prints list of previous commands"""
         # The last command will be 'history' - hence skipped
-        for cmd in self._cmd.history[:-1]:
+        history = self._cmd.history
+        for cmd in islice(history, max(0, len(history) - 1)):
             self.print(cmd)
 
     def shell(self):
@@ -913,26 +1214,19 @@ class Tui:
 
             while True:
                 self.CMD_PROMPT = '$'
+                self._cmdline_dirty = True
 
-                # Basic approach is to push request in waiting queue,
-                # and when condition is called execute the command in the _input_queue
-                condition = threading.Condition()
-                self._dispatch_queue.put(condition)
-
-                with condition:
-                    condition.wait()
+                # Basic approach is to push a private slot in waiting queue,
+                # and block till the command is put in that slot
+                slot = queue.SimpleQueue()
+                self._dispatch_queue.put(slot)
+                command = slot.get().strip()
 
-                try:
-                    command = self._input_queue.get()
-                    command = command.strip()
-                except queue.Empty:
-                    self.ERROR('TUI: Condition called but nothing in Input Stack')
-                    continue
-
-                self.print(command, curses.color_pair(self.COLOR_HIGHLIGHT))
+                self.print(command, self._attr_highlight)
 
                 # Do not accept commands on prompt till command is competed
                 self.CMD_PROMPT = '(command under progress)'
+                self._cmdline_dirty = True
                 self.INFO(f'Executing "{command}"')
 
                 cmd_parts = command.split()
@@ -946,11 +1240,19 @@ class Tui:
                         self.print(f'Command {function_name} not found')
                         continue
 
+                    # arguments are checked up front, so a TypeError raised within the command is not mistaken for usage
+                    minimum, maximum = self._cmd.get_arity(function_name)
+                    if len(function_args) < minimum or (maximum is not None and len(function_args) > maximum):
+                        expected = minimum if minimum == maximum else \
+                            f'{minimum} to {maximum if maximum is not None else "any"}'
+                        self.print(f'Command {function_name} takes {expected} argument(s), {len(function_args)} given')
+                        continue
+
                     try:
                         function(*function_args)
-                    except TypeError as e:
-                        self.print(f"Error: {e}")
-                        self.ERROR(f"Error: {e}")
+                    except Exception as e:
+                        self.print(f"Error: {e!r}")
+                        self.ERROR(f"Error: {e!r}")
 
     def prompt(self, prompt_type, message, options=None) -> str:
         """prompt - gets user input and returns as string
@@ -963,6 +1265,7 @@ class Tui:
         """
         if options is None:
             options = []
+        option_set = frozenset(options)
 
         # Confirm valid prompt type
         if prompt_type not in [self.PROMPT_YESNO, self.PROMPT_OPTIONS, self.PROMPT_PASSWORD, self.PROMPT_INPUT]:
@@ -975,9 +1278,9 @@ class Tui:
             return ""
 
         # same technique as others
-        #   - put condition on dispatch queue
-        #   - wait for condition to be notified
-        #   - get input from queue, confirm if suitable e.g. Option/ YesNo
+        #   - put private slot on dispatch queue
+        #   - block on slot till user input is received
+        #   - confirm if input is suitable e.g. Option/ YesNo
 
         with self._prompt_lock:
             old_prompt = self.CMD_PROMPT
@@ -988,28 +1291,23 @@ class Tui:
             elif prompt_type == self.PROMPT_OPTIONS:
                 self.CMD_PROMPT += str(options)
 
+            self._cmdline_dirty = True
+
             answer = ''
             while True:
-                condition = threading.Condition()
-                self._dispatch_queue.put(condition)
-
                 # mask mode is set for PROMPT_PASSWORD and reset when input if received
                 if prompt_type == self.PROMPT_PASSWORD:
                     self._cmd.set_mask_mode()
 
-                with condition:
-                    condition.wait()
-
-                try:
-                    answer = self._input_queue.get()
-                except queue.Empty:
-                    self.ERROR('TUI: Condition called but nothing in Input Stack')
+                slot = queue.SimpleQueue()
+                self._dispatch_queue.put(slot)
+                answer = slot.get()
 
-                if prompt_type == self.PROMPT_OPTIONS and answer not in options:
+                if prompt_type == self.PROMPT_OPTIONS and answer not in option_set:
                     self.print('TUI Prompt: Only answers within the option provided are permitted')
                     continue
 
-                if prompt_type == self.PROMPT_YESNO and answer not in ['y', 'Y', 'n', 'N', 'yes', 'Yes', 'no', 'No']:
+                if prompt_type == self.PROMPT_YESNO and answer.lower() not in _YESNO:
                     self.print('TUI Prompt: Only answers related to yes/no are permitted')
                     continue
 
@@ -1018,10 +1316,11 @@ class Tui:
             # for PROMPT_PASSWORD print masked content of same length else clear text
             if prompt_type == self.PROMPT_PASSWORD:
                 self._cmd.reset_mask_mode()
-                self.print(self.CMD_PROMPT + ' ' + '*' * len(answer))
+                self.print(self.CMD_PROMPT + ' ' + _mask(len(answer)))
             else:
                 self.print(self.CMD_PROMPT + ' ' + answer)
             self.CMD_PROMPT = old_prompt
+            self._cmdline_dirty = True
 
         return answer
 
@@ -1103,7 +1402,7 @@ class Tui:
         import socket
         hostname = socket.gethostname()
 
-        util_str = self._psutil.value
+        util_str = self._psutil
 
         self.print(f'Athena Version: {self._banner}')
         self.print(f'OS: {os_name}')
@@ -1138,8 +1437,8 @@ class Tui:
     def exit(self, error_code: int = 0):
         """exit - helper function parent to close tui gracefully"""
         self._quit = True
-        # Give sufficient time to run _shutdown, there is an internal napms(10)
-        curses.napms(20)
+        # Give sufficient time to run _shutdown, the main loop waits up to GETKEY_TIMEOUT_IDLE on getkey
+        curses.napms(self.GETKEY_TIMEOUT_IDLE + 10)
         exit(error_code)
 
 
@@ -3,9 +3,27 @@ import os
 import pathlib
 import re
 import configparser
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 global Print, Prompt, Spinner, ProgressBar, Exit
 
+# bytes requested per read while downloading or hashing, small chunks cost a write and progress update each
+_CHUNK_SIZE = 128 * 1024
+_HASH_BLOCK_SIZE = 1024 * 1024
+# buffer of downloaded files, several chunks are collected before they are written out
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# requests.Session shared by all downloads so that connections to the mirror are reused, created on first use
+_session = None
+
+# files of the source packages downloaded in parallel, within pool_maxsize of the session
+_DOWNLOAD_WORKERS = 8
+
+# (connect, read) timeout in seconds for each request, read timeout applies to each chunk of a streamed download
+_TIMEOUT = (5, 30)
+
 
 class DirectoryListing:
     """
@@ -85,6 +103,25 @@ class BaseDistribution:
         self.arch: str = arch
 
 
+def _get_session():
+    """Returns the shared requests.Session, created on first call so requests is only imported when needed.
+    Connections are pooled per host and transient failures (connection errors, 502/503/504) retried with backoff
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _session = session
+    return _session
+
+
 def download_file(url: str, filename: str) -> int:
     """Downloads file and updates progressbar in incremental manner.
         Args:
@@ -94,7 +131,6 @@ def download_file(url: str, filename: str) -> int:
         Returns:
             int: -1 for failure, file_size on success
     """
-    import requests
     from tqdm import tqdm
     from urllib.parse import urlsplit
     from requests import Timeout, TooManyRedirects, HTTPError, RequestException
@@ -102,14 +138,14 @@ def download_file(url: str, filename: str) -> int:
     name_strip = urlsplit(url).path.split('/')[-1]
     progress_format = '{percentage:3.0f}%[{bar:30}]{n_fmt}/{total_fmt} ({rate_fmt}) - {desc}'
     try:
-        response = requests.head(url)
+        # size is taken from the headers of the streamed response itself, no separate HEAD request
+        response = _get_session().get(url, stream=True, timeout=_TIMEOUT)
         file_size = int(response.headers.get('content-length', 0))
         progress_bar = tqdm(desc=f"{name_strip.ljust(15, ' ')}", ncols=80, total=file_size,
                             bar_format=progress_format, unit='iB', unit_scale=True, unit_divisor=1024)
-        response = requests.get(url, stream=True)
         if response.status_code == 200:
-            with open(filename, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=1024):
+            with open(filename, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
                         progress_bar.update(len(chunk))
@@ -121,12 +157,68 @@ def download_file(url: str, filename: str) -> int:
     return file_size
 
 
-def download_source(dependency_tree, dir_download, base_distribution: BaseDistribution):
-    import requests
-    from tqdm import tqdm
+def _fetch_source(session, file_name: str, file_meta: dict, base_url: str, dir_download: str, progress_bar,
+                  progress_lock):
+    """
+    Internal function to bring a single source file up to date, run in parallel by download_source
+    Args:
+        session: the shared requests.Session
+        file_name: name of the file within dir_download
+        file_meta: the 'path', 'md5' and 'size' of the file as listed by the source package
+        base_url: url of the archive, the file path is relative to it
+        dir_download: location where the file is kept
+        progress_bar: the shared tqdm instance, only updated while holding progress_lock
+        progress_lock: threading lock guarding progress_bar
+
+    Returns:
+        (int, bool): size accounted for (0 on connection failure), and whether the file was skipped as up to date
+    """
     from urllib.parse import urljoin
     from requests import Timeout, TooManyRedirects, HTTPError, RequestException
 
+    _url = urljoin(base_url, file_meta['path'])
+    _md5 = file_meta['md5']
+    _download_path = os.path.join(dir_download, file_name)
+    _size_expected = int(file_meta['size'])
+
+    # a missing file, or one with a different size is stale - only a file of the expected size is hashed
+    try:
+        _stale = os.path.getsize(_download_path) != _size_expected
+    except OSError:
+        _stale = True
+
+    # do hash check
+    if not _stale and _md5 == get_md5(_download_path):
+        with progress_lock:
+            progress_bar.update(_size_expected)
+        return _size_expected, True
+
+    # Failed - Lets download again
+    # hashed while being written, the file is not read back for verification
+    _hash = hashlib.md5()
+    try:
+        response = session.get(_url, stream=True, timeout=_TIMEOUT)
+        _size = int(response.headers.get('content-length', 0))
+        if response.status_code == 200:
+            with open(_download_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        _hash.update(chunk)
+                        with progress_lock:
+                            progress_bar.update(len(chunk))
+
+    except (ConnectionError, Timeout, TooManyRedirects, HTTPError, RequestException) as e:
+        Print(f"Error connecting to {_url}: {e}")
+        return 0, False
+
+    assert _hash.hexdigest() == _md5, f"Downloaded {file_name} hash mismatch"
+    return _size, False
+
+
+def download_source(dependency_tree, dir_download, base_distribution: BaseDistribution):
+    from tqdm import tqdm
+
     _downloaded_size = 0
     _download_size = dependency_tree.download_size
 
@@ -138,49 +230,27 @@ def download_source(dependency_tree, dir_download, base_distribution: BaseDistri
     for _pkg in dependency_tree.selected_srcs:
         _file_list.update(dependency_tree.selected_srcs[_pkg].files)
 
-    _index = 1
+    _index = 0
     _skipped = 0
     _total = len(_file_list)
 
     progress_format = '{desc} {percentage:3.0f}%[{bar:30}]{n_fmt}/{total_fmt} ({rate_fmt})'
     progress_bar = tqdm(ncols=80, total=_download_size, bar_format=progress_format, unit='iB', unit_scale=True)
-    for _file in _file_list:
-        progress_bar.set_description_str(desc=f" ({_index}/{_total})")
-
-        _url = urljoin(base_url, _file_list[_file]['path'])
-        _md5 = _file_list[_file]['md5']
-        _download_path = os.path.join(dir_download, _file)
-        _md5_check = get_md5(_download_path)
-
-        # do hash check
-        if _md5 != _md5_check:
-            # Failed - Lets download again
-            try:
-
-                response = requests.head(_url)
-                _size = int(response.headers.get('content-length', 0))
-
-                response = requests.get(_url, stream=True)
-                if response.status_code == 200:
-                    with open(_download_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=1024):
-                            if chunk:
-                                f.write(chunk)
-                                progress_bar.update(len(chunk))
-                _downloaded_size += _size
-
-            except (ConnectionError, Timeout, TooManyRedirects, HTTPError, RequestException) as e:
-                Print(f"Error connecting to {_url}: {e}")
-                continue
-
-            assert get_md5(_download_path) == _md5, f"Downloaded {_file} hash mismatch"
-
-        else:
-            _skipped += 1
-            progress_bar.update(int(_file_list[_file]['size']))
-            _downloaded_size += int(_file_list[_file]['size'])
-
-        _index += 1
+    progress_lock = threading.Lock()
+
+    # files are fetched in parallel over the shared session, hiding the round trip of each small file
+    session = _get_session()
+    with ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as executor:
+        futures = [executor.submit(_fetch_source, session, _file, _file_list[_file], base_url, dir_download,
+                                   progress_bar, progress_lock) for _file in _file_list]
+        for future in as_completed(futures):
+            # re-raises a hash mismatch of the file
+            _size, _was_skipped = future.result()
+            _downloaded_size += _size
+            _skipped += _was_skipped
+            _index += 1
+            with progress_lock:
+                progress_bar.set_description_str(desc=f" ({_index}/{_total})")
 
     progress_bar.clear()
     progress_bar.close()
@@ -189,17 +259,25 @@ def download_source(dependency_tree, dir_download, base_distribution: BaseDistri
     return _downloaded_size
 
 
-def search(re_string: str, base_string: str) -> str:
+@lru_cache(maxsize=1024)
+def _compile(re_string: str) -> re.Pattern:
+    """Compiles each pattern once, re's own cache is small and cleared as a whole when full"""
+    return re.compile(re_string)
+
+
+def search(re_string, base_string: str) -> str:
     """
     Internal function to simplify re.search() execution
     Args:
-        re_string: the regex to execute
+        re_string(str | re.Pattern): the regex to execute, a compiled pattern is used as is
         base_string: the content on which it is to be executed
 
     Returns:
         str: Match group, empty string on no match
     """
-    _match = re.search(re_string, base_string)
+    if not isinstance(re_string, re.Pattern):
+        re_string = _compile(re_string)
+    _match = re_string.search(base_string)
     if _match is not None:
         return _match.group(1)
     return ''
@@ -216,10 +294,14 @@ def get_md5(filepath: str) -> str:
     """
     md5_check = ''
     if os.path.isfile(filepath):
-        # Open the file and calculate the MD5 hash
+        # Open the file and calculate the MD5 hash, read in blocks so that large files are not held in memory
+        md5 = hashlib.md5()
         with open(filepath, 'rb') as f:
-            fdata = f.read()
-            md5_check = hashlib.md5(fdata).hexdigest()
+            block = f.read(_HASH_BLOCK_SIZE)
+            while block:
+                md5.update(block)
+                block = f.read(_HASH_BLOCK_SIZE)
+        md5_check = md5.hexdigest()
 
     return md5_check
 